@@ -1,25 +1,64 @@
 from PyQt6.QtWidgets import (
-	QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QListWidget, 
+	QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
 	QPushButton, QWidget, QDialog, QFormLayout, QLineEdit, QComboBox, 
-	QMessageBox, QLabel, QTabWidget, QMenu, QSystemTrayIcon, QInputDialog, QStatusBar
+	QMessageBox, QLabel, QMenu, QSystemTrayIcon, QInputDialog, QStatusBar,
+	QCheckBox, QSplitter, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QAction, QKeySequence, QShortcut
 import json
 import sys
 import os
 import platform
 import time
-from subprocess import run
+import hashlib
+import marshal
+import base64
+import binascii
+import random
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from subprocess import run, SubprocessError
+
+try:
+	from cryptography.fernet import Fernet, InvalidToken
+	from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+except ImportError:
+	# Only required for encrypted configs
+	Fernet = None
+	
+	class InvalidToken(Exception):
+		pass
+
+# Bump whenever the snapshot layout or the validation rules change
+CACHE_VERSION = 1
+
+ENCRYPTED_FORMAT = "remconn-encrypted-v1"
+
+# Connection lists kept alive at once; older ones are recycled
+MAX_CATEGORY_VIEWS = 20
+
+# Session watchdog tuning (seconds unless noted)
+WATCHDOG_INTERVAL_MS = 5000
+LAUNCH_GRACE = 10
+STABLE_AFTER = 60
+BACKOFF_BASE = 2
+BACKOFF_CAP = 300
+MAX_RECONNECT_ATTEMPTS = 8
+# Reconnects allowed across all sessions: a burst, then a steady rate per second
+RECONNECT_BURST = 5
+RECONNECT_RATE = 0.5
 
 class ConnectionWorker(QObject):
 	finished = pyqtSignal(str, bool)
 	progress = pyqtSignal(str)
 	
-	def __init__(self, session, cmd):
+	def __init__(self, session, cmd, attach=False):
 		super().__init__()
 		self.session = session
 		self.cmd = cmd
+		# Re-use an existing screen session rather than creating one
+		self.attach = attach
 		
 	def run(self):
 		self.progress.emit(f"Connecting to {self.session}...")
@@ -28,23 +67,297 @@ class ConnectionWorker(QObject):
 				run(self.cmd, shell=True)
 			else:
 				# Unix/Linux: use screen for persistent sessions
-				run(["screen", "-dm", "-S", self.session], check=True)
+				if not self.attach:
+					run(["screen", "-dm", "-S", self.session], check=True)
 				run(["screen", "-r", self.session, "-p", "0", "-X", "stuff", f"{self.cmd}\n"], check=True)
 				
 			self.finished.emit(f"Successfully connected to {self.session}", True)
 		except Exception as e:
 			self.finished.emit(f"Error connecting to {self.session}: {str(e)}", False)
 
+class SessionPoller(QObject):
+	"""Collect the state of all screen sessions off the GUI thread."""
+	finished = pyqtSignal(object)
+	
+	def run(self):
+		try:
+			self.finished.emit(self.snapshot())
+		except (OSError, SubprocessError):
+			self.finished.emit(None)
+	
+	def snapshot(self):
+		"""Return {session name: command running} for every screen session."""
+		listing = run(["screen", "-ls"], capture_output=True, text=True, timeout=5).stdout
+		processes = run(["ps", "-A", "-o", "pid=", "-o", "ppid="], capture_output=True, text=True, timeout=5).stdout
+		
+		children = {}
+		for line in processes.splitlines():
+			fields = line.split()
+			if len(fields) == 2 and fields[0].isdigit() and fields[1].isdigit():
+				children.setdefault(int(fields[1]), []).append(int(fields[0]))
+		
+		# Lines look like "\t12345.name\t(Detached)"
+		running = {}
+		for line in listing.splitlines():
+			pid, sep, name = line.strip().split("\t")[0].partition(".")
+			if not sep or not pid.isdigit():
+				continue
+			# screen -> shell -> remote command
+			shells = children.get(int(pid), [])
+			alive = any(children.get(shell) for shell in shells)
+			running[name] = running.get(name, False) or alive
+		return running
+
+class SessionWatchdog(QObject):
+	"""Track launched screen sessions and reconnect the ones that drop.
+	
+	Each tick runs one `screen -ls` and one `ps` no matter how many sessions
+	are tracked. A session has dropped when its screen is gone or its shell
+	has no child left, i.e. the remote command exited.
+	"""
+	dropped = pyqtSignal(str)
+	reconnect = pyqtSignal(str, str, bool)
+	pollRequested = pyqtSignal()
+	
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.sessions = {}
+		self.tokens = RECONNECT_BURST
+		self.last_refill = time.monotonic()
+		
+		# screen and ps run in a worker thread so a stale socket can't freeze the UI
+		self.polling = False
+		self.thread = QThread()
+		self.poller = SessionPoller()
+		self.poller.moveToThread(self.thread)
+		self.pollRequested.connect(self.poller.run)
+		self.poller.finished.connect(self.applyPoll)
+		
+		self.timer = QTimer(self)
+		self.timer.timeout.connect(self.poll)
+	
+	def track(self, session, category, reconnect):
+		"""Start (or restart) watching a session that has just been launched."""
+		state = self.sessions.setdefault(session, {"attempts": 0})
+		state.update(category=category, reconnect=reconnect, launched=time.monotonic(), retry_at=None)
+		
+		if not self.thread.isRunning():
+			self.thread.start()
+		if not self.timer.isActive():
+			self.timer.start(WATCHDOG_INTERVAL_MS)
+	
+	def untrack(self, session):
+		"""Stop watching a session."""
+		self.sessions.pop(session, None)
+		if not self.sessions:
+			self.timer.stop()
+	
+	def stop(self):
+		"""Stop polling and wait for the worker thread to finish."""
+		self.timer.stop()
+		self.thread.quit()
+		self.thread.wait()
+	
+	def take_token(self, now):
+		"""Rate limit reconnects across all sessions with a token bucket."""
+		self.tokens = min(RECONNECT_BURST, self.tokens + (now - self.last_refill) * RECONNECT_RATE)
+		self.last_refill = now
+		if self.tokens < 1:
+			return False
+		self.tokens -= 1
+		return True
+	
+	def backoff(self, attempts):
+		"""Exponential backoff with jitter so dropped sessions don't retry in lockstep."""
+		delay = min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempts)
+		return delay / 2 + random.uniform(0, delay / 2)
+	
+	def poll(self):
+		"""Ask the worker for a fresh snapshot, unless one is still running."""
+		if self.polling:
+			return
+		self.polling = True
+		self.pollRequested.emit()
+	
+	def applyPoll(self, running):
+		"""Act on a snapshot from the worker thread."""
+		self.polling = False
+		if running is None:
+			return
+		
+		now = time.monotonic()
+		for session, state in list(self.sessions.items()):
+			if state["retry_at"] is not None:
+				# Due sessions that miss out on a token wait for the next tick
+				if now >= state["retry_at"] and self.take_token(now):
+					state["retry_at"] = None
+					state["launched"] = now
+					self.reconnect.emit(session, state["category"], session in running)
+				continue
+			
+			if now - state["launched"] < LAUNCH_GRACE:
+				continue
+				
+			if running.get(session):
+				if now - state["launched"] >= STABLE_AFTER:
+					state["attempts"] = 0
+				continue
+			
+			if not state["reconnect"]:
+				self.untrack(session)
+				self.dropped.emit(f"Session {session} has ended")
+			elif state["attempts"] >= MAX_RECONNECT_ATTEMPTS:
+				self.untrack(session)
+				self.dropped.emit(f"Session {session} dropped, giving up after {MAX_RECONNECT_ATTEMPTS} attempts")
+			else:
+				delay = self.backoff(state["attempts"])
+				state["attempts"] += 1
+				state["retry_at"] = now + delay
+				self.dropped.emit(
+					f"Session {session} dropped, reconnecting in {delay:.0f}s "
+					f"(attempt {state['attempts']}/{MAX_RECONNECT_ATTEMPTS})"
+				)
+
+class EncryptedConfig(MutableMapping):
+	"""Config mapping stored as one encrypted chunk per category.
+	
+	The key is derived from the passphrase once and held for the session.
+	Category names are decrypted on open, but a category's connections only
+	when first accessed, and saving re-encrypts only the categories that changed.
+	"""
+	
+	def __init__(self, key, salt, check=None):
+		self.fernet = Fernet(key)
+		self.salt = salt
+		self.check = check or self.encrypt("remconn")
+		# category -> connections, or None while still encrypted
+		self.data = {}
+		# category -> (name token, body token, digest of the plaintext body)
+		self.chunks = {}
+	
+	@staticmethod
+	def derive_key(passphrase, salt):
+		"""Derive a Fernet key from the passphrase. Deliberately slow."""
+		kdf = Scrypt(salt=salt, length=32, n=2**15, r=8, p=1)
+		return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+	
+	@staticmethod
+	def digest(connections):
+		"""Fingerprint a category's connections to detect changes."""
+		return hashlib.sha256(json.dumps(connections, sort_keys=True).encode()).digest()
+	
+	@classmethod
+	def create(cls, config, passphrase):
+		"""Build an encrypted config from a plain dictionary."""
+		salt = os.urandom(16)
+		store = cls(cls.derive_key(passphrase, salt), salt)
+		store.update(config)
+		return store
+	
+	@classmethod
+	def open(cls, document, passphrase):
+		"""Unlock an encrypted config document.
+		
+		Raises InvalidToken on a wrong passphrase and ValueError if the
+		document is malformed or corrupted.
+		"""
+		try:
+			salt = base64.b64decode(document["salt"])
+			check = document["check"]
+			chunks = document["categories"]
+		except (KeyError, TypeError, binascii.Error):
+			raise ValueError("Encrypted configuration is missing required fields")
+		if not isinstance(check, str) or not isinstance(chunks, list):
+			raise ValueError("Encrypted configuration is missing required fields")
+		
+		# Only the check token tells a wrong passphrase apart from corruption
+		store = cls(cls.derive_key(passphrase, salt), salt, check)
+		store.decrypt(check)
+		
+		try:
+			for chunk in chunks:
+				if not isinstance(chunk["body"], str):
+					raise ValueError("Encrypted configuration is corrupted")
+				category = store.decrypt(chunk["name"])
+				store.data[category] = None
+				store.chunks[category] = (chunk["name"], chunk["body"], None)
+		except (KeyError, TypeError, AttributeError, InvalidToken):
+			raise ValueError("Encrypted configuration is corrupted")
+		return store
+	
+	def encrypt(self, text):
+		return self.fernet.encrypt(text.encode()).decode()
+	
+	def decrypt(self, token):
+		return self.fernet.decrypt(token.encode()).decode()
+	
+	def is_loaded(self, category):
+		"""Return True if the category's connections have been decrypted."""
+		return self.data[category] is not None
+	
+	def __getitem__(self, category):
+		connections = self.data[category]
+		if connections is None:
+			name_token, body_token, _ = self.chunks[category]
+			connections = json.loads(self.decrypt(body_token))
+			validate_config({category: connections})
+			self.data[category] = connections
+			self.chunks[category] = (name_token, body_token, self.digest(connections))
+		return connections
+	
+	def __setitem__(self, category, connections):
+		self.data[category] = connections
+	
+	def __delitem__(self, category):
+		del self.data[category]
+		self.chunks.pop(category, None)
+	
+	def __contains__(self, category):
+		# The inherited version would decrypt the category just to test membership
+		return category in self.data
+	
+	def __iter__(self):
+		return iter(self.data)
+	
+	def __len__(self):
+		return len(self.data)
+	
+	def to_document(self):
+		"""Return the JSON document to save, reusing tokens of unchanged categories."""
+		categories = []
+		for category, connections in self.data.items():
+			chunk = self.chunks.get(category)
+			
+			# Never decrypted means never changed
+			if connections is not None:
+				digest = self.digest(connections)
+				if not chunk or chunk[2] != digest:
+					name_token = chunk[0] if chunk else self.encrypt(category)
+					chunk = (name_token, self.encrypt(json.dumps(connections)), digest)
+					self.chunks[category] = chunk
+			
+			categories.append({"name": chunk[0], "body": chunk[1]})
+		
+		return {
+			"format": ENCRYPTED_FORMAT,
+			"kdf": "scrypt",
+			"salt": base64.b64encode(self.salt).decode(),
+			"check": self.check,
+			"categories": categories,
+		}
+
 class SSHConnectionManager(QMainWindow):
-	def __init__(self, config):
+	def __init__(self, config, load_stats=None):
 		super().__init__()
 		self.setWindowTitle("RemConn")
 		self.config = config
+		self.load_stats = load_stats or {}
 		self.session_threads = {}
 		self.setupUI()
 		self.setupShortcuts()
 		self.setupStatusBar()
 		self.setupSystemTray()
+		self.setupWatchdog()
 
 		# If no categories exist, prompt user to create one
 		if not self.config:
@@ -78,14 +391,22 @@ class SSHConnectionManager(QMainWindow):
 		search_layout.addWidget(self.search_box)
 		main_layout.addLayout(search_layout)
 		
-		# Create tab widget for categories
-		self.tab_widget = QTabWidget()
-		self.tab_widget.currentChanged.connect(self.onTabChanged)
+		# Category sidebar; connection lists are only built when a category is shown
+		self.category_list = QListWidget()
+		self.category_list.currentItemChanged.connect(self.onCategoryChanged)
+		self.category_stack = QStackedWidget()
 		
-		# Process each category
-		self.connection_lists = {}
+		splitter = QSplitter()
+		splitter.addWidget(self.category_list)
+		splitter.addWidget(self.category_stack)
+		splitter.setStretchFactor(1, 1)
+		
+		# Process each category; connection_lists runs least to most recently viewed
+		self.category_items = {}
+		self.connection_lists = OrderedDict()
 		for category in self.config.keys():
-			self.addCategoryTab(category)
+			self.addCategoryItem(category)
+		self.category_list.setCurrentRow(0)
 		
 		# Create button layout
 		button_layout = QHBoxLayout()
@@ -98,6 +419,8 @@ class SSHConnectionManager(QMainWindow):
 		add_connection_btn.setIcon(QIcon.fromTheme("list-add"))
 		add_category_btn = QPushButton("Add Category")
 		add_category_btn.setIcon(QIcon.fromTheme("folder-new"))
+		encrypt_btn = QPushButton("Encrypt Config")
+		encrypt_btn.setIcon(QIcon.fromTheme("security-high"))
 		save_btn = QPushButton("Save Changes")
 		save_btn.setIcon(QIcon.fromTheme("document-save"))
 		close_btn = QPushButton("Close")
@@ -107,6 +430,7 @@ class SSHConnectionManager(QMainWindow):
 		edit_btn.clicked.connect(self.editSelectedConnection)
 		add_connection_btn.clicked.connect(self.add_connection_dialog)
 		add_category_btn.clicked.connect(self.add_category_dialog)
+		encrypt_btn.clicked.connect(self.encrypt_config_dialog)
 		save_btn.clicked.connect(lambda: self.save_config("config.json"))
 		close_btn.clicked.connect(self.close)
 		
@@ -114,17 +438,18 @@ class SSHConnectionManager(QMainWindow):
 		button_layout.addWidget(edit_btn)
 		button_layout.addWidget(add_connection_btn)
 		button_layout.addWidget(add_category_btn)
+		button_layout.addWidget(encrypt_btn)
 		button_layout.addWidget(save_btn)
 		button_layout.addWidget(close_btn)
 		
 		# Assemble layout
-		main_layout.addWidget(self.tab_widget)
+		main_layout.addWidget(splitter)
 		main_layout.addLayout(button_layout)
 		main_widget.setLayout(main_layout)
 		self.setCentralWidget(main_widget)
 		
 		# Set window size
-		self.resize(600, 400)
+		self.resize(800, 400)
 	
 	def setupShortcuts(self):
 		# Connect shortcut
@@ -150,7 +475,14 @@ class SSHConnectionManager(QMainWindow):
 	def setupStatusBar(self):
 		self.statusBar = QStatusBar()
 		self.setStatusBar(self.statusBar)
-		self.statusBar.showMessage("Ready", 3000)
+		
+		if self.load_stats:
+			self.statusBar.showMessage(
+				f"Ready - config loaded from {self.load_stats['source']} "
+				f"in {self.load_stats['elapsed'] * 1000:.1f} ms", 5000
+			)
+		else:
+			self.statusBar.showMessage("Ready", 3000)
 	
 	def setupSystemTray(self):
 		self.tray_icon = QSystemTrayIcon(QIcon.fromTheme("network-server"), self)
@@ -169,30 +501,124 @@ class SSHConnectionManager(QMainWindow):
 		self.tray_icon.activated.connect(self.onTrayIconActivated)
 		self.tray_icon.show()
 	
+	def setupWatchdog(self):
+		# Sessions are only tracked through screen, which Windows lacks
+		self.watchdog = None
+		if platform.system() == "Windows":
+			return
+			
+		self.watchdog = SessionWatchdog(self)
+		self.watchdog.dropped.connect(lambda message: self.statusBar.showMessage(message, 10000))
+		self.watchdog.reconnect.connect(self.onSessionReconnect)
+	
+	def onSessionReconnect(self, session, category, attach):
+		"""Re-run a dropped session's command, unless it has since been removed
+		or no longer wants reconnecting."""
+		if (category not in self.config or session not in self.config[category]
+				or not self.config[category][session].get("reconnect")):
+			self.watchdog.untrack(session)
+			return
+		self.connectToSession(session, category, attach)
+	
 	def onTrayIconActivated(self, reason):
 		if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
 			self.show()
 	
-	def addCategoryTab(self, category):
-		category_widget = QWidget()
-		category_layout = QVBoxLayout()
-		
-		# Create list widget for this category
-		list_widget = self.create_list_widget(list(self.config[category].keys()))
+	def addCategoryItem(self, category):
+		"""Add a category to the sidebar without building its connection list."""
+		item = QListWidgetItem()
+		item.setData(Qt.ItemDataRole.UserRole, category)
+		self.category_items[category] = item
+		self.category_list.addItem(item)
+		self.updateCategoryCount(category)
+	
+	def removeCategoryItem(self, category):
+		"""Remove a category from the sidebar and drop its connection list."""
+		item = self.category_items.pop(category, None)
+		if item is not None:
+			self.category_list.takeItem(self.category_list.row(item))
+			
+		list_widget = self.connection_lists.pop(category, None)
+		if list_widget is not None:
+			self.category_stack.removeWidget(list_widget)
+			list_widget.deleteLater()
+	
+	def updateCategoryCount(self, category):
+		"""Show the connection count next to a category name."""
+		item = self.category_items.get(category)
+		if item is None:
+			return
+			
+		# Counting an encrypted category would mean decrypting it
+		if isinstance(self.config, EncryptedConfig) and not self.config.is_loaded(category):
+			item.setText(category)
+		else:
+			item.setText(f"{category} ({len(self.config[category])})")
+	
+	def getCategoryView(self, category):
+		"""Return the connection list for a category, creating it on first use.
+		
+		At most MAX_CATEGORY_VIEWS lists exist; past that the least recently
+		viewed category's list is cleared and reused. A category that cannot
+		be decrypted gets an empty, disabled list.
+		"""
+		list_widget = self.connection_lists.get(category)
+		if list_widget is not None:
+			self.connection_lists.move_to_end(category)
+			return list_widget
+		
+		connections = self.readCategory(category)
+		names = list(connections.keys()) if connections is not None else []
+		
+		if len(self.connection_lists) >= MAX_CATEGORY_VIEWS:
+			_, list_widget = self.connection_lists.popitem(last=False)
+			list_widget.clear()
+			list_widget.addItems(names)
+		else:
+			list_widget = self.create_list_widget(names)
+			
+			# Enable double-click to connect
+			list_widget.itemDoubleClicked.connect(self.connectToSelected)
+			
+			# Enable context menu
+			list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+			list_widget.customContextMenuRequested.connect(
+				lambda pos, lw=list_widget: self.showContextMenu(pos, lw)
+			)
+			self.category_stack.addWidget(list_widget)
+			
+		list_widget.setEnabled(connections is not None)
 		self.connection_lists[category] = list_widget
+		return list_widget
+	
+	def readCategory(self, category, parent=None):
+		"""Return a category's connections, or None if it cannot be decrypted.
 		
-		# Enable double-click to connect
-		list_widget.itemDoubleClicked.connect(self.connectToSelected)
-		
-		# Enable context menu
-		list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-		list_widget.customContextMenuRequested.connect(
-			lambda pos, lw=list_widget: self.showContextMenu(pos, lw)
-		)
-		
-		category_layout.addWidget(list_widget)
-		category_widget.setLayout(category_layout)
-		self.tab_widget.addTab(category_widget, category)
+		The category's encrypted chunk is kept as is, so saving still writes it back.
+		"""
+		try:
+			return self.config[category]
+		except (InvalidToken, ValueError):
+			QMessageBox.critical(
+				parent or self, "Unreadable Category",
+				f"Category '{category}' could not be decrypted. It is left unchanged."
+			)
+			return None
+	
+	def addConnectionItem(self, category, name):
+		"""Show a connection in its category's list, if that list exists."""
+		list_widget = self.connection_lists.get(category)
+		if list_widget is not None and not list_widget.findItems(name, Qt.MatchFlag.MatchExactly):
+			list_widget.addItem(name)
+		self.updateCategoryCount(category)
+	
+	def removeConnectionItem(self, category, name):
+		"""Remove a connection from its category's list, if that list exists."""
+		list_widget = self.connection_lists.get(category)
+		if list_widget is not None:
+			for item in list_widget.findItems(name, Qt.MatchFlag.MatchExactly):
+				list_widget.takeItem(list_widget.row(item))
+		self.updateCategoryCount(category)
 	
 	def create_list_widget(self, items):
 		"""Create a QListWidget for SSH connections."""
@@ -200,12 +626,26 @@ class SSHConnectionManager(QMainWindow):
 		widget.addItems(items)
 		return widget
 	
+	def create_reconnect_checkbox(self, checked):
+		"""Create the per-connection auto-reconnect option."""
+		checkbox = QCheckBox("Reconnect automatically if the session drops")
+		checkbox.setChecked(checked)
+		checkbox.setEnabled(self.watchdog is not None)
+		return checkbox
+	
 	def get_current_category(self):
-		"""Get the currently selected category tab."""
-		return self.tab_widget.tabText(self.tab_widget.currentIndex())
+		"""Get the currently selected category."""
+		item = self.category_list.currentItem()
+		return item.data(Qt.ItemDataRole.UserRole) if item else ""
 	
-	def onTabChanged(self):
-		"""Handle tab change by updating the search filter."""
+	def onCategoryChanged(self, current, previous):
+		"""Show the selected category's list and apply the search filter."""
+		if current is None:
+			return
+			
+		category = current.data(Qt.ItemDataRole.UserRole)
+		self.category_stack.setCurrentWidget(self.getCategoryView(category))
+		self.updateCategoryCount(category)
 		self.filterConnections(self.search_box.text())
 	
 	def filterConnections(self, text):
@@ -274,7 +714,7 @@ class SSHConnectionManager(QMainWindow):
 		for session in selected_items:
 			self.connectToSession(session, current_category)
 	
-	def connectToSession(self, session, category):
+	def connectToSession(self, session, category, attach=False):
 		"""Connect to a specific session using a worker thread."""
 		if session not in self.config[category]:
 			QMessageBox.critical(
@@ -283,11 +723,12 @@ class SSHConnectionManager(QMainWindow):
 			)
 			return
 		
-		cmd = self.config[category][session]["cmd"]
+		settings = self.config[category][session]
+		cmd = settings["cmd"]
 		
 		# Create worker and thread
 		self.thread = QThread()
-		self.worker = ConnectionWorker(session, cmd)
+		self.worker = ConnectionWorker(session, cmd, attach)
 		self.worker.moveToThread(self.thread)
 		
 		# Connect signals
@@ -304,6 +745,9 @@ class SSHConnectionManager(QMainWindow):
 		# Store thread reference
 		self.session_threads[session] = self.thread
 		
+		if self.watchdog:
+			self.watchdog.track(session, category, settings.get("reconnect", False))
+		
 		# Update status
 		self.statusBar.showMessage(f"Connecting to {session}...")
 	
@@ -345,16 +789,18 @@ class SSHConnectionManager(QMainWindow):
 		
 		# Pre-fill with existing values
 		category_combo = QComboBox()
-		for i in range(self.tab_widget.count()):
-			category_combo.addItem(self.tab_widget.tabText(i))
+		category_combo.addItems(list(self.config.keys()))
 		category_combo.setCurrentText(category)
 		
+		settings = self.config[category][connection_name]
 		conn_name = QLineEdit(connection_name)
-		cmd = QLineEdit(self.config[category][connection_name]["cmd"])
+		cmd = QLineEdit(settings["cmd"])
+		reconnect = self.create_reconnect_checkbox(settings.get("reconnect", False))
 		
 		layout.addRow("Category:", category_combo)
 		layout.addRow("Name:", conn_name)
 		layout.addRow("Command:", cmd)
+		layout.addRow("", reconnect)
 		
 		def update_connection():
 			"""Update the connection with new values."""
@@ -365,6 +811,9 @@ class SSHConnectionManager(QMainWindow):
 			if not new_name or not new_cmd:
 				QMessageBox.critical(dialog, "Error", "All fields are required.")
 				return
+				
+			if new_category in self.config and self.readCategory(new_category, dialog) is None:
+				return
 			
 			# Handle category change
 			if new_category != category:
@@ -372,38 +821,36 @@ class SSHConnectionManager(QMainWindow):
 				del self.config[category][connection_name]
 				
 				# Update list widgets
-				for i in range(self.connection_lists[category].count()):
-					if self.connection_lists[category].item(i).text() == connection_name:
-						self.connection_lists[category].takeItem(i)
-						break
+				self.removeConnectionItem(category, connection_name)
 				
 				# Ensure new category exists
 				if new_category not in self.config:
 					self.config[new_category] = {}
-					self.addCategoryTab(new_category)
+					self.addCategoryItem(new_category)
 			elif new_name != connection_name:
 				# Just remove the old name if it's changing within same category
 				del self.config[category][connection_name]
 				
 				# Update list widget
-				for i in range(self.connection_lists[category].count()):
-					if self.connection_lists[category].item(i).text() == connection_name:
-						self.connection_lists[category].takeItem(i)
-						break
+				self.removeConnectionItem(category, connection_name)
+			
+			# A renamed connection's old session must not be reconnected
+			if new_name != connection_name and self.watchdog:
+				self.watchdog.untrack(connection_name)
 			
 			# Add with new values
 			if new_category not in self.config:
 				self.config[new_category] = {}
 			
-			self.config[new_category][new_name] = {"cmd": new_cmd}
+			new_settings = dict(settings, cmd=new_cmd)
+			if reconnect.isChecked():
+				new_settings["reconnect"] = True
+			else:
+				new_settings.pop("reconnect", None)
+			self.config[new_category][new_name] = new_settings
 			
 			# Update the list widget for the new category
-			if new_category in self.connection_lists:
-				# Only add if it doesn't already exist
-				items = [self.connection_lists[new_category].item(i).text() 
-						 for i in range(self.connection_lists[new_category].count())]
-				if new_name not in items:
-					self.connection_lists[new_category].addItem(new_name)
+			self.addConnectionItem(new_category, new_name)
 				
 			QMessageBox.information(dialog, "Success", f"Updated connection '{new_name}'.")
 			dialog.accept()
@@ -451,12 +898,11 @@ class SSHConnectionManager(QMainWindow):
 		if reply == QMessageBox.StandardButton.Yes:
 			# Remove from config
 			del self.config[category][connection_name]
+			if self.watchdog:
+				self.watchdog.untrack(connection_name)
 			
 			# Remove from list widget
-			for i in range(self.connection_lists[category].count()):
-				if self.connection_lists[category].item(i).text() == connection_name:
-					self.connection_lists[category].takeItem(i)
-					break
+			self.removeConnectionItem(category, connection_name)
 					
 			self.statusBar.showMessage(f"Deleted connection '{connection_name}'", 3000)
 			
@@ -479,15 +925,8 @@ class SSHConnectionManager(QMainWindow):
 			# Remove category from config
 			del self.config[category]
 			
-			# Remove tab
-			for i in range(self.tab_widget.count()):
-				if self.tab_widget.tabText(i) == category:
-					self.tab_widget.removeTab(i)
-					break
-					
-			# Remove from connection lists
-			if category in self.connection_lists:
-				del self.connection_lists[category]
+			# Remove from sidebar and connection lists
+			self.removeCategoryItem(category)
 				
 			self.statusBar.showMessage(f"Deleted empty category '{category}'", 3000)
 	
@@ -500,15 +939,16 @@ class SSHConnectionManager(QMainWindow):
 		
 		# Category dropdown with existing categories
 		category_combo = QComboBox()
-		for i in range(self.tab_widget.count()):
-			category_combo.addItem(self.tab_widget.tabText(i))
+		category_combo.addItems(list(self.config.keys()))
 		
 		conn_name = QLineEdit()
 		cmd = QLineEdit()
+		reconnect = self.create_reconnect_checkbox(False)
 		
 		layout.addRow("Category:", category_combo)
 		layout.addRow("Name:", conn_name)
 		layout.addRow("Command:", cmd)
+		layout.addRow("", reconnect)
 		
 		def add_connection():
 			"""Add the new connection to the list and update config."""
@@ -520,6 +960,9 @@ class SSHConnectionManager(QMainWindow):
 				QMessageBox.critical(dialog, "Error", "All fields are required.")
 				return
 				
+			if category in self.config and self.readCategory(category, dialog) is None:
+				return
+				
 			# Check for duplicate names
 			if category in self.config and name in self.config[category]:
 				reply = QMessageBox.question(
@@ -534,16 +977,14 @@ class SSHConnectionManager(QMainWindow):
 			# Add to the configuration dictionary
 			if category not in self.config:
 				self.config[category] = {}
-				self.addCategoryTab(category)
+				self.addCategoryItem(category)
 			
 			self.config[category][name] = {"cmd": command}
+			if reconnect.isChecked():
+				self.config[category][name]["reconnect"] = True
 			
 			# Update the list widget - handles dynamic addition
-			if category in self.connection_lists:
-				items = [self.connection_lists[category].item(i).text() 
-						 for i in range(self.connection_lists[category].count())]
-				if name not in items:
-					self.connection_lists[category].addItem(name)
+			self.addConnectionItem(category, name)
 			
 			self.statusBar.showMessage(f"Added connection '{name}' to category '{category}'", 3000)
 			dialog.accept()
@@ -578,12 +1019,12 @@ class SSHConnectionManager(QMainWindow):
 				QMessageBox.critical(self, "Error", f"Category '{category_name}' already exists.")
 				return
 				
-			# Add to config and create new tab
+			# Add to config and sidebar
 			self.config[category_name] = {}
-			self.addCategoryTab(category_name)
+			self.addCategoryItem(category_name)
 			
-			# Switch to the new tab
-			self.tab_widget.setCurrentIndex(self.tab_widget.count() - 1)
+			# Switch to the new category
+			self.category_list.setCurrentRow(self.category_list.count() - 1)
 			
 			self.statusBar.showMessage(f"Added category '{category_name}'", 3000)
 			
@@ -598,6 +1039,54 @@ class SSHConnectionManager(QMainWindow):
 				if reply == QMessageBox.StandardButton.Yes:
 					self.add_connection_dialog()
 	
+	def encrypt_config_dialog(self):
+		"""Convert the configuration to the encrypted format."""
+		if Fernet is None:
+			QMessageBox.warning(
+				self, "Encrypt Config",
+				"Encryption requires the 'cryptography' package:\n\npip install cryptography"
+			)
+			return
+			
+		if isinstance(self.config, EncryptedConfig):
+			QMessageBox.information(self, "Encrypt Config", "Configuration is already encrypted.")
+			return
+		
+		passphrase, ok = QInputDialog.getText(
+			self, "Encrypt Config", "New passphrase:", QLineEdit.EchoMode.Password
+		)
+		if not ok or not passphrase:
+			return
+			
+		confirm, ok = QInputDialog.getText(
+			self, "Encrypt Config", "Confirm passphrase:", QLineEdit.EchoMode.Password
+		)
+		if not ok:
+			return
+		if confirm != passphrase:
+			QMessageBox.warning(self, "Encrypt Config", "Passphrases do not match.")
+			return
+		
+		plain_config = self.config
+		self.config = EncryptedConfig.create(plain_config, passphrase)
+		
+		# A backup here would just be another plaintext copy
+		if not self.save_config("config.json", backup=False):
+			self.config = plain_config
+			return
+		
+		# The plaintext startup snapshot would defeat the encryption
+		try:
+			os.remove(config_cache_file("config.json"))
+		except FileNotFoundError:
+			pass
+			
+		QMessageBox.information(
+			self, "Encrypt Config",
+			"Configuration encrypted. Backups from earlier saves (config.json.bak.*) "
+			"are still in clear text and should be deleted."
+		)
+	
 	def deleteConnection(self, connection_name, category):
 		"""Delete a connection from configuration and UI."""
 		if connection_name not in self.config[category]:
@@ -613,12 +1102,11 @@ class SSHConnectionManager(QMainWindow):
 		if reply == QMessageBox.StandardButton.Yes:
 			# Remove from config
 			del self.config[category][connection_name]
+			if self.watchdog:
+				self.watchdog.untrack(connection_name)
 			
 			# Remove from list widget
-			for i in range(self.connection_lists[category].count()):
-				if self.connection_lists[category].item(i).text() == connection_name:
-					self.connection_lists[category].takeItem(i)
-					break
+			self.removeConnectionItem(category, connection_name)
 					
 			self.statusBar.showMessage(f"Deleted connection '{connection_name}'", 3000)
 			
@@ -634,15 +1122,8 @@ class SSHConnectionManager(QMainWindow):
 					# Remove category from config
 					del self.config[category]
 					
-					# Remove tab
-					for i in range(self.tab_widget.count()):
-						if self.tab_widget.tabText(i) == category:
-							self.tab_widget.removeTab(i)
-							break
-							
-					# Remove from connection lists
-					if category in self.connection_lists:
-						del self.connection_lists[category]
+					# Remove from sidebar and connection lists
+					self.removeCategoryItem(category)
 						
 					self.statusBar.showMessage(f"Deleted empty category '{category}'", 3000)
 					
@@ -650,21 +1131,34 @@ class SSHConnectionManager(QMainWindow):
 					if not self.config:
 						self.promptFirstCategory()
 
-	def save_config(self, config_file="config.json"):
-		"""Save the current configuration to the JSON file."""
+	def save_config(self, config_file="config.json", backup=True):
+		"""Save the current configuration to the JSON file. Returns True on success."""
 		try:
 			# Create a backup first
-			if os.path.exists(config_file):
+			if backup and os.path.exists(config_file):
 				backup_file = f"{config_file}.bak.{int(time.time())}"
 				with open(config_file, "r") as src, open(backup_file, "w") as dst:
 					dst.write(src.read())
 					
-			with open(config_file, "w") as f:
-				json.dump(self.config, f, indent=2)
+			encrypted = isinstance(self.config, EncryptedConfig)
+			document = self.config.to_document() if encrypted else self.config
+			
+			# Write a temporary file first so a failed save never truncates the config
+			raw = json.dumps(document, indent=2).encode()
+			tmp_file = f"{config_file}.tmp"
+			with open(tmp_file, "wb") as f:
+				f.write(raw)
+			os.replace(tmp_file, config_file)
+			
+			# Refresh the snapshot so the next start is a cache hit
+			if not encrypted:
+				write_config_cache(config_file, self.config, config_fingerprint(config_file, raw))
 				
 			self.statusBar.showMessage(f"Configuration saved to {config_file}", 3000)
+			return True
 		except Exception as e:
 			QMessageBox.critical(self, "Error", f"Failed to save configuration: {str(e)}")
+			return False
 	
 	def closeEvent(self, event):
 		"""Override closeEvent to save configuration on exit."""
@@ -674,38 +1168,139 @@ class SSHConnectionManager(QMainWindow):
 			QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel
 		)
 		
+		if reply not in (QMessageBox.StandardButton.Yes, QMessageBox.StandardButton.No):
+			event.ignore()
+			return
+			
 		if reply == QMessageBox.StandardButton.Yes:
 			self.save_config()
-			event.accept()
-		elif reply == QMessageBox.StandardButton.No:
-			event.accept()
-		else:
-			event.ignore()
+		if self.watchdog:
+			self.watchdog.stop()
+		event.accept()
+
+def config_cache_file(config_file):
+	"""Return the path of the binary snapshot kept next to the config file."""
+	return f"{config_file}.cache"
 
-def load_config(config_file):
-	"""Load the configuration JSON file."""
+def config_fingerprint(config_file, raw):
+	"""Key a snapshot to the exact contents of the config file it was built from."""
+	stat = os.stat(config_file)
+	return (CACHE_VERSION, marshal.version, stat.st_mtime_ns, stat.st_size, hashlib.sha256(raw).hexdigest())
+
+def read_config_cache(config_file, fingerprint):
+	"""Return the cached, pre-validated config, or None on a cache miss.
+	
+	The snapshot uses marshal, which only rebuilds plain data and never runs
+	code, so a tampered cache file cannot execute anything at startup.
+	"""
 	try:
-		with open(config_file, "r") as f:
-			config = json.load(f)
-			
-		# Validate config structure
-		if not isinstance(config, dict):
-			raise ValueError("Configuration file must contain a dictionary")
+		with open(config_cache_file(config_file), "rb") as f:
+			snapshot = marshal.loads(f.read())
+	except (OSError, EOFError, ValueError, TypeError):
+		# Missing, truncated or written by an incompatible version
+		return None
+	
+	if not isinstance(snapshot, dict) or snapshot.get("key") != fingerprint:
+		return None
+	config = snapshot.get("config")
+	return config if isinstance(config, dict) else None
+
+def write_config_cache(config_file, config, fingerprint):
+	"""Store a validated config as a binary snapshot. Failures are not fatal."""
+	cache_file = config_cache_file(config_file)
+	tmp_file = f"{cache_file}.tmp"
+	try:
+		with open(tmp_file, "wb") as f:
+			f.write(marshal.dumps({"key": fingerprint, "config": config}))
+		os.replace(tmp_file, cache_file)
+	except (OSError, ValueError):
+		pass
+
+def validate_config(config):
+	"""Check the config has the category -> connection -> settings layout."""
+	if not isinstance(config, dict):
+		raise ValueError("Configuration file must contain a dictionary")
+		
+	# Ensure all entries have the expected format
+	for category, connections in config.items():
+		if not isinstance(connections, dict):
+			raise ValueError(f"Category '{category}' must contain a dictionary of connections")
 			
-		# Ensure all entries have the expected format
-		for category, connections in config.items():
-			if not isinstance(connections, dict):
-				raise ValueError(f"Category '{category}' must contain a dictionary of connections")
+		for name, settings in connections.items():
+			if not isinstance(settings, dict) or "cmd" not in settings:
+				raise ValueError(f"Connection '{name}' in category '{category}' must have a 'cmd' setting")
+
+def unlock_config(document):
+	"""Prompt for the passphrase until the encrypted config opens.
+	
+	Exits rather than falling back to an empty configuration, which could
+	otherwise be saved over the encrypted file.
+	"""
+	if Fernet is None:
+		QMessageBox.critical(
+			None, "Encrypted Config",
+			"The configuration is encrypted but the 'cryptography' package is not installed.\n\n"
+			"pip install cryptography"
+		)
+		sys.exit(1)
+	
+	passphrase = os.environ.get("REMCONN_PASSPHRASE")
+	while True:
+		if passphrase is None:
+			passphrase, ok = QInputDialog.getText(
+				None, "Unlock Config", "Config passphrase:", QLineEdit.EchoMode.Password
+			)
+			if not ok:
+				sys.exit(0)
 				
-			for name, settings in connections.items():
-				if not isinstance(settings, dict) or "cmd" not in settings:
-					raise ValueError(f"Connection '{name}' in category '{category}' must have a 'cmd' setting")
-					
+		try:
+			return EncryptedConfig.open(document, passphrase)
+		except InvalidToken:
+			QMessageBox.warning(None, "Unlock Config", "Incorrect passphrase.")
+			passphrase = None
+		except ValueError as e:
+			QMessageBox.critical(None, "Encrypted Config", f"Cannot open the encrypted configuration: {str(e)}.")
+			sys.exit(1)
+
+def load_config(config_file, stats=None):
+	"""Load the configuration JSON file.
+	
+	A pre-validated snapshot is used when the JSON is unchanged since it was
+	written; otherwise the file is parsed, validated and the snapshot rebuilt.
+	Encrypted configs never use a snapshot. If given, stats is filled with
+	the load source and elapsed time (plain configs only).
+	"""
+	start = time.perf_counter()
+	try:
+		with open(config_file, "rb") as f:
+			raw = f.read()
+		fingerprint = config_fingerprint(config_file, raw)
+		
+		# A snapshot must never stand in for the passphrase. A plain config
+		# that merely mentions the marker just loses its snapshot.
+		maybe_encrypted = ENCRYPTED_FORMAT.encode() in raw
+		
+		config = None if maybe_encrypted else read_config_cache(config_file, fingerprint)
+		source = "cache"
+		if config is None:
+			config = json.loads(raw)
+			if isinstance(config, dict) and config.get("format") == ENCRYPTED_FORMAT:
+				# Not timed: unlocking waits on the user and the key derivation
+				return unlock_config(config)
+				
+			validate_config(config)
+			if not maybe_encrypted:
+				write_config_cache(config_file, config, fingerprint)
+			source = "JSON"
+		
+		if stats is not None:
+			stats["source"] = source
+			stats["elapsed"] = time.perf_counter() - start
 		return config
 			
 	except FileNotFoundError:
 		return {}
-	except json.JSONDecodeError:
+	except (json.JSONDecodeError, UnicodeDecodeError):
 		QMessageBox.critical(
 			None, "Invalid Config", 
 			"Configuration file is not a valid JSON. Using empty configuration."
@@ -725,8 +1320,9 @@ def main():
 	# Set application icon
 	app.setWindowIcon(QIcon.fromTheme("network-server"))
 	
-	config = load_config("config.json")
-	main_window = SSHConnectionManager(config)
+	load_stats = {}
+	config = load_config("config.json", load_stats)
+	main_window = SSHConnectionManager(config, load_stats)
 	main_window.show()
 	sys.exit(app.exec())
 
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("cryptography")
+
+from remconn import EncryptedConfig
+
+
+def test_membership_does_not_decrypt():
+	store = EncryptedConfig.create({"a": {"host": {"cmd": "ssh host"}}}, "pw")
+	document = store.to_document()
+	document["categories"][0]["body"] = "corrupted"
+	
+	config = EncryptedConfig.open(document, "pw")
+	assert "a" in config
+	assert "b" not in config
+	assert not config.is_loaded("a")
+
+
+def test_open_rejects_non_string_body():
+	document = EncryptedConfig.create({"a": {}}, "pw").to_document()
+	document["categories"][0]["body"] = 5
+	
+	with pytest.raises(ValueError):
+		EncryptedConfig.open(document, "pw")